@@ -8,11 +8,21 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.exceptions import (
+    ConfigEntryAuthFailed,
+    ConfigEntryNotReady,
+    ServiceValidationError,
+)
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
-    ALL_SERVICES,
+    APP_LIMIT_PLATFORMS,
+    AVAILABLE_PLATFORMS,
+    CONF_REFRESH_TOKEN,
+    DATA_ACCOUNT_INDEX,
+    DATA_COORDINATORS,
+    DATA_PRIMARY,
     DOMAIN,
     PLATFORMS,
     SERVICE_APPROVE_REQUEST,
@@ -34,9 +44,12 @@ from .const import (
     SERVICE_UNLOCK_ACCOUNT,
 )
 from .coordinator import FamilySafetyDataUpdateCoordinator
+from .helpers import token_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 # ──────────────────────────────────────────────────────────────────────
 # Service Schemas
 # ──────────────────────────────────────────────────────────────────────
@@ -48,7 +61,7 @@ SERVICE_BLOCK_APP_SCHEMA = vol.Schema({
 
 SERVICE_LOCK_PLATFORM_SCHEMA = vol.Schema({
     vol.Required("account_id"): cv.string,
-    vol.Required("platform"): vol.In(["Windows", "Xbox", "Mobile"]),
+    vol.Required("platform"): vol.In(AVAILABLE_PLATFORMS),
     vol.Optional("duration_hours", default=24): vol.All(
         vol.Coerce(int), vol.Range(min=1, max=168)
     ),
@@ -56,7 +69,7 @@ SERVICE_LOCK_PLATFORM_SCHEMA = vol.Schema({
 
 SERVICE_UNLOCK_PLATFORM_SCHEMA = vol.Schema({
     vol.Required("account_id"): cv.string,
-    vol.Required("platform"): vol.In(["Windows", "Xbox", "Mobile"]),
+    vol.Required("platform"): vol.In(AVAILABLE_PLATFORMS),
 })
 
 SERVICE_APPROVE_REQUEST_SCHEMA = vol.Schema({
@@ -92,7 +105,7 @@ SERVICE_SET_APP_TIME_LIMIT_SCHEMA = vol.Schema({
     vol.Required("account_id"): cv.string,
     vol.Required("app_id"): cv.string,
     vol.Required("app_name"): cv.string,
-    vol.Optional("platform", default="windows"): vol.In(["windows", "xbox", "mobile"]),
+    vol.Optional("platform", default="windows"): vol.In(APP_LIMIT_PLATFORMS),
     vol.Required("hours"): vol.All(vol.Coerce(int), vol.Range(min=0, max=24)),
     vol.Optional("minutes", default=0): vol.All(vol.Coerce(int), vol.Range(min=0, max=59)),
     vol.Optional("start_time", default="07:00:00"): cv.string,
@@ -103,7 +116,7 @@ SERVICE_REMOVE_APP_TIME_LIMIT_SCHEMA = vol.Schema({
     vol.Required("account_id"): cv.string,
     vol.Required("app_id"): cv.string,
     vol.Required("app_name"): cv.string,
-    vol.Optional("platform", default="windows"): vol.In(["windows", "xbox", "mobile"]),
+    vol.Optional("platform", default="windows"): vol.In(APP_LIMIT_PLATFORMS),
 })
 
 SERVICE_BLOCK_WEBSITE_SCHEMA = vol.Schema({
@@ -140,41 +153,64 @@ SERVICE_UNLOCK_ACCOUNT_SCHEMA = vol.Schema({
 })
 
 
-def _get_coordinator(hass: HomeAssistant) -> FamilySafetyDataUpdateCoordinator | None:
-    """Get the first available coordinator."""
+def _get_coordinator(
+    hass: HomeAssistant, account_id: str | None = None
+) -> FamilySafetyDataUpdateCoordinator | None:
+    """Get the coordinator owning an account, or the first available one."""
     if DOMAIN not in hass.data:
         return None
-    for coordinator in hass.data[DOMAIN].values():
-        if isinstance(coordinator, FamilySafetyDataUpdateCoordinator):
-            return coordinator
-    return None
+    if account_id is not None:
+        return hass.data[DOMAIN].get(DATA_ACCOUNT_INDEX, {}).get(account_id)
+    return hass.data[DOMAIN].get(DATA_PRIMARY)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the integration and register its services (once per HA run)."""
+    _register_services(hass)
+    return True
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old config entry."""
+    if entry.version > 1:
+        # Downgraded from a future version
+        return False
+
+    if entry.minor_version < 2:
+        # 1.1 entries used the first 20 characters of the token as their id
+        hass.config_entries.async_update_entry(
+            entry,
+            unique_id=token_unique_id(entry.data[CONF_REFRESH_TOKEN]),
+            minor_version=2,
+        )
+        _LOGGER.debug("Migrated config entry %s to version 1.2", entry.entry_id)
+
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Microsoft Family Safety from a config entry."""
     coordinator = FamilySafetyDataUpdateCoordinator(hass, entry)
 
-    # Load persisted screentime policies (for lock/unlock survival across restarts)
-    await coordinator.async_load_saved_screentime()
-
     try:
         await coordinator.async_config_entry_first_refresh()
     except ConfigEntryAuthFailed:
         # Real auth failure — let HA trigger reauth flow
+        await coordinator.async_cleanup()
         raise
     except Exception as err:
+        # Release the web API session before HA retries with a new coordinator
+        await coordinator.async_cleanup()
         _LOGGER.warning("Microsoft Family Safety not ready, will retry: %s", err)
         raise ConfigEntryNotReady from err
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data.setdefault(DOMAIN, {}).setdefault(DATA_COORDINATORS, {})
+    hass.data[DOMAIN][DATA_COORDINATORS][entry.entry_id] = coordinator
+    # Account-less services (request approve/deny) go to the first entry
+    hass.data[DOMAIN].setdefault(DATA_PRIMARY, coordinator)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register services (only once)
-    if not hass.services.has_service(DOMAIN, SERVICE_BLOCK_APP):
-        _register_services(hass)
-
     # Reload on options change (e.g. update interval)
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
 
@@ -256,10 +292,14 @@ def _register_services(hass: HomeAssistant) -> None:
 
     def make_handler(method_name, extract_args):
         async def handler(call: ServiceCall) -> None:
-            coordinator = _get_coordinator(hass)
+            account_id = call.data.get("account_id")
+            coordinator = _get_coordinator(hass, account_id)
             if coordinator is None:
-                _LOGGER.error("No Family Safety coordinator available")
-                return
+                if account_id is not None:
+                    raise ServiceValidationError(
+                        f"No Family Safety coordinator manages account {account_id}"
+                    )
+                raise ServiceValidationError("No Family Safety coordinator available")
             await getattr(coordinator, method_name)(*extract_args(call.data))
         return handler
 
@@ -274,12 +314,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinators = hass.data[DOMAIN][DATA_COORDINATORS]
+        coordinator = coordinators.pop(entry.entry_id)
         await coordinator.async_cleanup()
 
-        # Unregister services if no more entries
-        if not hass.data[DOMAIN]:
-            for service in ALL_SERVICES:
-                hass.services.async_remove(DOMAIN, service)
+        if hass.data[DOMAIN].get(DATA_PRIMARY) is coordinator:
+            if coordinators:
+                hass.data[DOMAIN][DATA_PRIMARY] = next(iter(coordinators.values()))
+            else:
+                hass.data[DOMAIN].pop(DATA_PRIMARY)
 
     return unload_ok
@@ -82,7 +82,15 @@ class FamilySafetyWebAPI:
     async def _ensure_session(self) -> None:
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            # Keep aggregator connections alive across the burst of
+            # per-account calls (and follow-up service calls) and cache DNS
+            # for roughly one poll interval.
+            connector = aiohttp.TCPConnector(
+                limit=10, ttl_dns_cache=300, keepalive_timeout=75
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=timeout
+            )
 
     async def _ensure_auth(self) -> None:
         """Acquire a valid access token for the mobile API."""
@@ -254,7 +262,7 @@ class FamilySafetyWebAPI:
         }
 
         # Microsoft web APIs require the canary cookie as __requestverificationtoken header
-        canary = getattr(self, "_web_canary", None)
+        canary = self._web_canary
         if not canary:
             for cookie in self._web_cookies:
                 name = cookie.get("name", "")
@@ -279,7 +287,7 @@ class FamilySafetyWebAPI:
             if resp.status == 200:
                 if resp.content_type and "json" in resp.content_type:
                     data = await resp.json()
-                    _LOGGER.debug("Web API success: %s", str(data)[:300])
+                    _LOGGER.debug("Web API success: %.300s", data)
                     return data
                 return None
 
@@ -367,7 +375,7 @@ class FamilySafetyWebAPI:
             return None
 
         # Always warm up the session first to extract canary token
-        if not getattr(self, "_web_canary", None):
+        if not self._web_canary:
             _LOGGER.debug("Web API: warming up session to extract canary token...")
             canary = await self._warm_web_session()
             if canary:
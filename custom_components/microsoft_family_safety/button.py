@@ -15,6 +15,7 @@ from .const import (
     ATTR_FIRST_NAME,
     ATTR_REQUEST_ID,
     ATTR_USER_ID,
+    DATA_COORDINATORS,
     DOMAIN,
 )
 from .coordinator import FamilySafetyDataUpdateCoordinator
@@ -28,7 +29,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Microsoft Family Safety buttons."""
-    coordinator: FamilySafetyDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators = hass.data[DOMAIN][DATA_COORDINATORS]
+    coordinator: FamilySafetyDataUpdateCoordinator = coordinators[entry.entry_id]
 
     known_accounts: set[str] = set()
 
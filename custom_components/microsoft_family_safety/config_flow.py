@@ -5,12 +5,12 @@ import logging
 from typing import Any
 from urllib.parse import unquote
 
+import aiohttp
 from pyfamilysafety.authenticator import Authenticator
 from pyfamilysafety.exceptions import HttpException
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.const import CONF_NAME
 import homeassistant.helpers.config_validation as cv
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
@@ -29,21 +29,38 @@ from .const import (
     DOMAIN,
     ERROR_AUTH_FAILED,
     INTEGRATION_NAME,
-    MS_AUTH_PARAMS,
-    MS_LOGIN_URL,
+    MS_AUTH_URL,
 )
+from .helpers import token_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _build_auth_url() -> str:
-    """Build the Microsoft authentication URL.
+_PLATFORM_OPTIONS = {p: p for p in AVAILABLE_PLATFORMS}
 
-    Returns:
-        Complete authentication URL with all required parameters
-    """
-    params = "&".join([f"{k}={v}" for k, v in MS_AUTH_PARAMS.items()])
-    return f"{MS_LOGIN_URL}?{params}"
+_REDIRECT_SCHEMA = vol.Schema({vol.Required(CONF_REDIRECT_URL): str})
+
+_AUTH_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_REDIRECT_URL): str,
+        vol.Optional(
+            CONF_UPDATE_INTERVAL,
+            default=DEFAULT_UPDATE_INTERVAL,
+        ): vol.All(vol.Coerce(int), vol.Range(min=30, max=3600)),
+        vol.Optional(
+            CONF_PLATFORMS,
+            default=DEFAULT_PLATFORMS,
+        ): cv.multi_select(_PLATFORM_OPTIONS),
+    }
+)
+
+# Auth step when no add-on was auto-detected: also ask for its URL + API key
+_AUTH_SCHEMA_MANUAL_ADDON = _AUTH_SCHEMA.extend(
+    {
+        vol.Optional(CONF_AUTH_URL, default=""): str,
+        vol.Optional(CONF_API_KEY, default=""): str,
+    }
+)
 
 
 async def validate_redirect_url(hass: HomeAssistant, redirect_url: str) -> dict[str, Any]:
@@ -65,23 +82,29 @@ async def validate_redirect_url(hass: HomeAssistant, redirect_url: str) -> dict[
             authenticator.expires
         )
 
+        refresh_token = authenticator.refresh_token
         return {
             "title": INTEGRATION_NAME,
-            "refresh_token": authenticator.refresh_token,
+            "refresh_token": refresh_token,
+            "unique_id": token_unique_id(refresh_token),
         }
 
     except HttpException as err:
-        _LOGGER.error("HTTP error during authentication: %s", err)
+        # The form reports the failure to the user, so keep the log quiet
+        _LOGGER.debug("HTTP error during authentication: %s", err)
+        raise InvalidAuth from err
+    except (KeyError, IndexError, ValueError) as err:
+        # Malformed redirect URL (no usable code in it)
+        _LOGGER.debug("Could not parse redirect URL: %s", err)
         raise InvalidAuth from err
-    except Exception as err:
-        _LOGGER.error("Unexpected error during authentication: %s", err)
-        raise InvalidAuth(f"Cannot connect: {err}") from err
 
 
 class FamilySafetyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Microsoft Family Safety."""
 
     VERSION = 1
+    # 2: unique id is a BLAKE2b token hash instead of the token's prefix
+    MINOR_VERSION = 2
 
     @staticmethod
     def async_get_options_flow(
@@ -115,7 +138,7 @@ class FamilySafetyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_auth()
 
         description_placeholders = {
-            "auth_url": _build_auth_url(),
+            "auth_url": MS_AUTH_URL,
         }
 
         # Add addon status info to placeholders
@@ -132,6 +155,28 @@ class FamilySafetyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors={},
         )
 
+    async def _async_validate_redirect(
+        self, user_input: dict[str, Any], errors: dict[str, str]
+    ) -> dict[str, Any] | None:
+        """Validate the submitted redirect URL, recording any form error.
+
+        Shared by the initial auth step and the reauth step. Returns the
+        validation info on success, or None with ``errors`` populated.
+        """
+        redirect_url = user_input.get(CONF_REDIRECT_URL, "").strip()
+        if not redirect_url:
+            errors["base"] = "no_redirect_url"
+            return None
+
+        try:
+            return await validate_redirect_url(self.hass, redirect_url)
+        except InvalidAuth:
+            errors["base"] = ERROR_AUTH_FAILED
+        except (aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.debug("Could not reach Microsoft during authentication: %s", err)
+            errors["base"] = "cannot_connect"
+        return None
+
     async def async_step_auth(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -139,7 +184,6 @@ class FamilySafetyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            redirect_url = user_input.get(CONF_REDIRECT_URL, "").strip()
             update_interval = user_input.get(
                 CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
             )
@@ -147,82 +191,58 @@ class FamilySafetyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             auth_url = user_input.get(CONF_AUTH_URL, "").strip() or None
             api_key = user_input.get(CONF_API_KEY, "").strip() or None
 
-            # If user provided a custom auth URL, validate it
-            if auth_url:
-                from .auth.addon_client import AddonCookieClient
-
-                addon_client = AddonCookieClient(self.hass, auth_url=auth_url)
-                if not await addon_client._check_url_available(auth_url):
-                    _LOGGER.warning(
-                        "Custom auth URL %s is not reachable, saving anyway", auth_url
-                    )
-
-            if not redirect_url:
-                errors["base"] = "no_redirect_url"
-            else:
-                try:
-                    info = await validate_redirect_url(self.hass, redirect_url)
-
-                    refresh_token = info["refresh_token"]
-                    await self.async_set_unique_id(refresh_token[:20])
-                    self._abort_if_unique_id_configured()
-
-                    # Build data dict with auth_url if we have one
-                    data = {
-                        CONF_REFRESH_TOKEN: refresh_token,
-                    }
-                    # Store auth URL: user-provided > auto-detected
-                    effective_auth_url = auth_url or self._detected_url
-                    if effective_auth_url:
-                        data[CONF_AUTH_URL] = effective_auth_url
-                    # Optional API key (only needed when HA cannot read the
-                    # add-on's shared .api_key file, e.g. standalone on another host)
-                    if api_key:
-                        data[CONF_API_KEY] = api_key
-
-                    return self.async_create_entry(
-                        title=info["title"],
-                        data=data,
-                        options={
-                            CONF_UPDATE_INTERVAL: update_interval,
-                            CONF_PLATFORMS: platforms,
-                        },
-                    )
-
-                except InvalidAuth:
-                    errors["base"] = ERROR_AUTH_FAILED
-                except Exception:
-                    _LOGGER.exception("Unexpected exception during authentication")
-                    errors["base"] = "unknown"
+            info = await self._async_validate_redirect(user_input, errors)
+            if info is not None:
+                await self.async_set_unique_id(info["unique_id"])
+                self._abort_if_unique_id_configured()
 
-        description_placeholders = {
-            "auth_url": _build_auth_url(),
-        }
+                # If user provided a custom auth URL, check it only once the
+                # entry is actually about to be created
+                if auth_url:
+                    from .auth.addon_client import AddonCookieClient
 
-        # Build schema - include auth URL field if no addon was auto-detected
-        schema_fields = {
-            vol.Required(CONF_REDIRECT_URL): str,
-            vol.Optional(
-                CONF_UPDATE_INTERVAL,
-                default=DEFAULT_UPDATE_INTERVAL,
-            ): vol.All(vol.Coerce(int), vol.Range(min=30, max=3600)),
-            vol.Optional(
-                CONF_PLATFORMS,
-                default=DEFAULT_PLATFORMS,
-            ): cv.multi_select(
-                {p: p for p in AVAILABLE_PLATFORMS}
-            ),
+                    addon_client = AddonCookieClient(self.hass, auth_url=auth_url)
+                    if not await addon_client._check_url_available(auth_url):
+                        _LOGGER.warning(
+                            "Custom auth URL %s is not reachable, saving anyway", auth_url
+                        )
+
+                # Build data dict with auth_url if we have one
+                data = {
+                    CONF_REFRESH_TOKEN: info["refresh_token"],
+                }
+                # Store auth URL: user-provided > auto-detected
+                effective_auth_url = auth_url or self._detected_url
+                if effective_auth_url:
+                    data[CONF_AUTH_URL] = effective_auth_url
+                # Optional API key (only needed when HA cannot read the
+                # add-on's shared .api_key file, e.g. standalone on another host)
+                if api_key:
+                    data[CONF_API_KEY] = api_key
+
+                return self.async_create_entry(
+                    title=info["title"],
+                    data=data,
+                    options={
+                        CONF_UPDATE_INTERVAL: update_interval,
+                        CONF_PLATFORMS: platforms,
+                    },
+                )
+
+        description_placeholders = {
+            "auth_url": MS_AUTH_URL,
         }
 
         # Only show auth URL + API key fields if addon was NOT auto-detected
         # (otherwise HA reads the shared .api_key file automatically)
         if self._detected_source == "none":
-            schema_fields[vol.Optional(CONF_AUTH_URL, default="")] = str
-            schema_fields[vol.Optional(CONF_API_KEY, default="")] = str
+            data_schema = _AUTH_SCHEMA_MANUAL_ADDON
+        else:
+            data_schema = _AUTH_SCHEMA
 
         return self.async_show_form(
             step_id="auth",
-            data_schema=vol.Schema(schema_fields),
+            data_schema=data_schema,
             description_placeholders=description_placeholders,
             errors=errors,
         )
@@ -238,51 +258,29 @@ class FamilySafetyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            redirect_url = user_input.get(CONF_REDIRECT_URL, "").strip()
-
-            if not redirect_url:
-                errors["base"] = "no_redirect_url"
-            else:
-                try:
-                    info = await validate_redirect_url(self.hass, redirect_url)
-
-                    entry = self.hass.config_entries.async_get_entry(
-                        self.context["entry_id"]
-                    )
-                    if entry:
-                        # Preserve existing auth_url and API key when reauthing
-                        new_data = {
-                            CONF_REFRESH_TOKEN: info["refresh_token"],
-                        }
-                        if CONF_AUTH_URL in entry.data:
-                            new_data[CONF_AUTH_URL] = entry.data[CONF_AUTH_URL]
-                        if CONF_API_KEY in entry.data:
-                            new_data[CONF_API_KEY] = entry.data[CONF_API_KEY]
-
-                        self.hass.config_entries.async_update_entry(
-                            entry,
-                            data=new_data,
-                        )
-                        await self.hass.config_entries.async_reload(entry.entry_id)
-                        return self.async_abort(reason="reauth_successful")
+            info = await self._async_validate_redirect(user_input, errors)
+            entry = self.hass.config_entries.async_get_entry(
+                self.context["entry_id"]
+            )
+            if info is not None and entry:
+                # Preserve existing auth_url and API key when reauthing
+                new_data = {
+                    CONF_REFRESH_TOKEN: info["refresh_token"],
+                }
+                if CONF_AUTH_URL in entry.data:
+                    new_data[CONF_AUTH_URL] = entry.data[CONF_AUTH_URL]
+                if CONF_API_KEY in entry.data:
+                    new_data[CONF_API_KEY] = entry.data[CONF_API_KEY]
 
-                except InvalidAuth:
-                    errors["base"] = ERROR_AUTH_FAILED
-                except Exception:
-                    _LOGGER.exception("Unexpected exception during reauth")
-                    errors["base"] = "unknown"
+                return self.async_update_reload_and_abort(entry, data=new_data)
 
         description_placeholders = {
-            "auth_url": _build_auth_url(),
+            "auth_url": MS_AUTH_URL,
         }
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_REDIRECT_URL): str,
-                }
-            ),
+            data_schema=_REDIRECT_SCHEMA,
             description_placeholders=description_placeholders,
             errors=errors,
         )
@@ -326,9 +324,7 @@ class FamilySafetyOptionsFlow(config_entries.OptionsFlow):
                     vol.Optional(
                         CONF_PLATFORMS,
                         default=current_platforms,
-                    ): cv.multi_select(
-                        {p: p for p in AVAILABLE_PLATFORMS}
-                    ),
+                    ): cv.multi_select(_PLATFORM_OPTIONS),
                     vol.Optional(
                         CONF_AUTH_URL,
                         default=current_auth_url,
@@ -1,5 +1,6 @@
 """Constants for the Microsoft Family Safety integration."""
 from typing import Final
+from urllib.parse import urlencode
 
 # Integration constants
 DOMAIN: Final = "microsoft_family_safety"
@@ -13,6 +14,13 @@ CONF_UPDATE_INTERVAL: Final = "update_interval"
 CONF_AUTH_URL: Final = "auth_url"
 CONF_API_KEY: Final = "api_key"
 
+# hass.data[DOMAIN] key for the entry_id -> coordinator map
+DATA_COORDINATORS: Final = "coordinators"
+# hass.data[DOMAIN] key for the account_id -> coordinator index
+DATA_ACCOUNT_INDEX: Final = "_by_account"
+# hass.data[DOMAIN] key for the coordinator serving account-less services
+DATA_PRIMARY: Final = "_primary"
+
 # Defaults
 DEFAULT_UPDATE_INTERVAL: Final = 300  # 5 minutes in seconds
 DEFAULT_TIMEOUT: Final = 30
@@ -21,6 +29,8 @@ DEFAULT_TIMEOUT: Final = 30
 CONF_PLATFORMS: Final = "platforms"
 AVAILABLE_PLATFORMS: Final = ["Windows", "Xbox", "Mobile"]
 DEFAULT_PLATFORMS: Final = ["Windows"]
+# Platform keys accepted by the web API for per-app time limits
+APP_LIMIT_PLATFORMS: Final = ["windows", "xbox", "mobile"]
 
 # Days of week, in Microsoft API order (index 0 = Sunday)
 DAY_KEYS: Final = [
@@ -43,6 +53,7 @@ MS_AUTH_PARAMS: Final = {
     "lw": "1",
     "fl": "easi2"
 }
+MS_AUTH_URL: Final = f"{MS_LOGIN_URL}?{urlencode(MS_AUTH_PARAMS)}"
 
 # API
 API_TIMEOUT: Final = 30
@@ -101,25 +112,5 @@ SERVICE_SET_ACQUISITION_POLICY: Final = "set_acquisition_policy"
 SERVICE_LOCK_ACCOUNT: Final = "lock_account"
 SERVICE_UNLOCK_ACCOUNT: Final = "unlock_account"
 
-ALL_SERVICES: Final = [
-    SERVICE_BLOCK_APP,
-    SERVICE_UNBLOCK_APP,
-    SERVICE_LOCK_PLATFORM,
-    SERVICE_UNLOCK_PLATFORM,
-    SERVICE_APPROVE_REQUEST,
-    SERVICE_DENY_REQUEST,
-    SERVICE_SET_SCREENTIME_LIMIT,
-    SERVICE_SET_SCREENTIME_INTERVALS,
-    SERVICE_SET_APP_TIME_LIMIT,
-    SERVICE_REMOVE_APP_TIME_LIMIT,
-    SERVICE_BLOCK_WEBSITE,
-    SERVICE_REMOVE_WEBSITE,
-    SERVICE_TOGGLE_WEB_FILTER,
-    SERVICE_SET_AGE_RATING,
-    SERVICE_SET_ACQUISITION_POLICY,
-    SERVICE_LOCK_ACCOUNT,
-    SERVICE_UNLOCK_ACCOUNT,
-]
-
 # Platforms
 PLATFORMS: Final = ["sensor", "switch", "button", "number", "time"]
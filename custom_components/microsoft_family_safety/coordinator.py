@@ -6,8 +6,11 @@ Dual authentication strategy:
 """
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta
 import logging
+from operator import attrgetter
+import re
 from typing import Any
 
 from pyfamilysafety import FamilySafety
@@ -15,7 +18,7 @@ from pyfamilysafety.account import Account
 from pyfamilysafety.application import Application
 from pyfamilysafety.device import Device
 from pyfamilysafety.enum import OverrideTarget, OverrideType
-from pyfamilysafety.exceptions import HttpException
+from pyfamilysafety.exceptions import HttpException, RequestDenied, Unauthorized
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -27,14 +30,18 @@ from ._pyfamilysafety_compat import apply_patches
 from .api_client import FamilySafetyWebAPI
 from .auth.addon_client import AddonCookieClient
 from .const import (
+    API_TIMEOUT,
+    AVAILABLE_PLATFORMS,
     CONF_API_KEY,
     CONF_AUTH_URL,
     CONF_REFRESH_TOKEN,
     CONF_UPDATE_INTERVAL,
+    DATA_ACCOUNT_INDEX,
     DAY_KEYS,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     ERROR_AUTH_FAILED,
+    ERROR_TIMEOUT,
     ERROR_TOKEN_EXPIRED,
 )
 
@@ -45,6 +52,55 @@ STORAGE_VERSION = 1
 
 AUTH_NOTIFICATION_ID = "familysafety_auth_expired"
 
+# Seconds allowed for closing the web API sessions on unload
+_CLOSE_TIMEOUT = 5
+
+# Pretty platform name (as used by services/switches) -> pyfamilysafety target
+_PLATFORM_TARGETS: dict[str, OverrideTarget] = {
+    platform: OverrideTarget.from_pretty(platform) for platform in AVAILABLE_PLATFORMS
+}
+
+
+# Account attributes copied verbatim into the coordinator data
+_ACCOUNT_FIELDS = (
+    "user_id",
+    "first_name",
+    "surname",
+    "profile_picture",
+    "account_balance",
+    "account_currency",
+)
+_get_account_fields = attrgetter(*_ACCOUNT_FIELDS)
+
+# Device attributes copied verbatim into the coordinator data
+_DEVICE_FIELDS = (
+    "device_id",
+    "device_name",
+    "device_class",
+    "device_make",
+    "device_model",
+    "os_name",
+    "last_seen",
+    "blocked",
+)
+_get_device_fields = attrgetter(*_DEVICE_FIELDS)
+
+# Fallback for HTTP errors that carry no usable status code
+_AUTH_ERR_RE = re.compile(r"401|authentication", re.IGNORECASE)
+
+
+def _is_auth_error(err: HttpException) -> bool:
+    """Return True if a pyfamilysafety HTTP error means the token was rejected.
+
+    pyfamilysafety raises Unauthorized for 401s on its own, and otherwise
+    passes the status code as the second exception argument.
+    """
+    if isinstance(err, Unauthorized):
+        return True
+    if len(err.args) > 1 and err.args[1] == 401:
+        return True
+    return _AUTH_ERR_RE.search(str(err)) is not None
+
 
 def _range_to_slots(
     start_hour: int, start_minute: int, end_hour: int, end_minute: int
@@ -67,7 +123,7 @@ def _ms_to_minutes(milliseconds: int | None) -> int:
     """Convert milliseconds to minutes."""
     if not milliseconds:
         return 0
-    return int(milliseconds / 60000)
+    return int(milliseconds) // 60000
 
 
 class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -87,6 +143,13 @@ class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.web_api: FamilySafetyWebAPI | None = None
         self._accounts: dict[str, Account] = {}
         self._devices: dict[str, Device] = {}
+        # Last published applications list per account, with its source fingerprint
+        self._applications_cache: dict[str, tuple[tuple, list[dict[str, Any]]]] = {}
+        # Last published record per device, with its source fingerprint
+        self._device_cache: dict[str, tuple[tuple, dict[str, Any]]] = {}
+        # (account_id, app_id) -> app record, for the snapshot in _app_index_source
+        self._app_index: dict[tuple[str, str], dict[str, Any]] = {}
+        self._app_index_source: dict[str, Any] | None = None
         self._is_retrying_auth = False
         # Saved screentime state for lock/unlock per account (persisted via HA Store)
         self._saved_screentime: dict[str, dict[str, Any]] = {}
@@ -115,6 +178,15 @@ class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Persist saved screentime policies to HA storage."""
         await self._store.async_save(self._saved_screentime)
 
+    async def _async_setup(self) -> None:
+        """Prepare the coordinator before its first refresh.
+
+        Called once by the coordinator framework, so restoring saved policies
+        and logging in are kept out of the update path.
+        """
+        await self.async_load_saved_screentime()
+        await self._async_setup_api()
+
     async def _async_setup_api(self) -> None:
         """Set up the Family Safety API client."""
         refresh_token = self.entry.data[CONF_REFRESH_TOKEN]
@@ -137,8 +209,8 @@ class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             _LOGGER.debug("Family Safety API client initialized successfully")
         except HttpException as err:
-            err_str = str(err).lower()
-            if "401" in err_str or "403" in err_str or "authentication" in err_str:
+            # A 403 while logging in means the token itself was refused
+            if isinstance(err, RequestDenied) or _is_auth_error(err):
                 _LOGGER.error("Authentication failed during API setup: %s", err)
                 raise ConfigEntryAuthFailed(ERROR_AUTH_FAILED) from err
             _LOGGER.warning("Transient API error during setup, will retry: %s", err)
@@ -196,6 +268,23 @@ class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except (IndexError, ValueError):
             return None
 
+    def get_app_record(self, account_id: str, app_id: str) -> dict[str, Any] | None:
+        """Get an application's published record.
+
+        The (account, app) index is rebuilt once per coordinator snapshot, so
+        every app switch resolves its record with one lookup instead of
+        scanning the account's applications.
+        """
+        data = self.data
+        if data is not self._app_index_source:
+            self._app_index_source = data
+            self._app_index = {
+                (acc_id, app["app_id"]): app
+                for acc_id, account in (data["accounts"] if data else {}).items()
+                for app in account["applications"]
+            }
+        return self._app_index.get((account_id, app_id))
+
     # ──────────────────────────────────────────────────────────────────────
     # Existing controls (via pyfamilysafety)
     # ──────────────────────────────────────────────────────────────────────
@@ -206,7 +295,7 @@ class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if app is None:
             raise ValueError(f"Application {app_id} not found for account {account_id}")
         await app.block_app()
-        await self.async_request_refresh()
+        self._publish_applications(account_id)
 
     async def async_unblock_app(self, account_id: str, app_id: str) -> None:
         """Unblock an application."""
@@ -214,7 +303,24 @@ class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if app is None:
             raise ValueError(f"Application {app_id} not found for account {account_id}")
         await app.unblock_app()
-        await self.async_request_refresh()
+        self._publish_applications(account_id)
+
+    def _publish_applications(self, account_id: str) -> None:
+        """Publish an account's application state without a full refresh.
+
+        pyfamilysafety updates Application.blocked itself once the policy
+        call succeeds, so the snapshot can be rebuilt from the local objects;
+        the next scheduled poll reconciles anything else.
+        """
+        account = self._accounts.get(account_id)
+        if account is None or not self.data:
+            return
+        accounts = dict(self.data["accounts"])
+        accounts[account_id] = {
+            **accounts[account_id],
+            **self._application_fields(account),
+        }
+        self.async_set_updated_data({**self.data, "accounts": accounts})
 
     async def async_lock_platform(
         self, account_id: str, platform: str, valid_until: datetime | None = None
@@ -223,7 +329,7 @@ class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         account = self._accounts.get(account_id)
         if account is None:
             raise ValueError(f"Account {account_id} not found")
-        target = OverrideTarget.from_pretty(platform)
+        target = _PLATFORM_TARGETS[platform]
         if valid_until is None:
             valid_until = datetime.now() + timedelta(hours=24)
         await account.override_device(target, OverrideType.UNTIL, valid_until)
@@ -234,7 +340,7 @@ class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         account = self._accounts.get(account_id)
         if account is None:
             raise ValueError(f"Account {account_id} not found")
-        target = OverrideTarget.from_pretty(platform)
+        target = _PLATFORM_TARGETS[platform]
         await account.override_device(target, OverrideType.CANCEL)
         await self.async_request_refresh()
 
@@ -707,45 +813,77 @@ class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if account.blocked_platforms:
             blocked_platforms_list = [str(p) for p in account.blocked_platforms]
 
-        account_data = {
-            "user_id": account.user_id,
-            "first_name": account.first_name,
-            "surname": account.surname,
-            "profile_picture": account.profile_picture,
-            "today_screentime_usage": _ms_to_minutes(account.today_screentime_usage),
-            "average_screentime_usage": _ms_to_minutes(account.average_screentime_usage),
-            "account_balance": account.account_balance,
-            "account_currency": account.account_currency,
-            "blocked_platforms": blocked_platforms_list,
-            "devices": [],
-            "applications": [
-                {
-                    "app_id": app.app_id,
-                    "app_name": app.name,
-                    "blocked": app.blocked,
-                    "icon": app.icon,
-                    "usage_minutes": round(app.usage, 1) if app.usage else 0,
-                }
-                for app in account.applications
-            ],
-        }
+        account_data = dict(zip(_ACCOUNT_FIELDS, _get_account_fields(account)))
+        account_data.update(
+            today_screentime_usage=_ms_to_minutes(account.today_screentime_usage),
+            average_screentime_usage=_ms_to_minutes(account.average_screentime_usage),
+            display_name=f"{account.first_name or ''} {account.surname or ''}".strip(),
+            blocked_platforms=blocked_platforms_list,
+            **self._application_fields(account),
+        )
         return account_id, account_data
 
+    def _application_fields(self, account: Account) -> dict[str, Any]:
+        """Return the applications list with its counts, aggregated once."""
+        applications = self._transform_applications(account)
+        return {
+            "applications": applications,
+            "application_count": len(applications),
+            "blocked_app_count": sum(1 for app in applications if app["blocked"]),
+        }
+
+    def _transform_applications(self, account: Account) -> list[dict[str, Any]]:
+        """Transform an account's applications, reusing the previous list if unchanged.
+
+        The list is never mutated once published, so sharing it between
+        snapshots is safe and spares rebuilding one dict per app each poll.
+        """
+        fingerprint = tuple(
+            (app.app_id, app.name, app.blocked, app.icon, app.usage)
+            for app in account.applications
+        )
+        cached = self._applications_cache.get(account.user_id)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        applications = [
+            {
+                "app_id": app_id,
+                "app_name": name,
+                "blocked": blocked,
+                "icon": icon,
+                "usage_minutes": round(usage, 1) if usage else 0,
+            }
+            for app_id, name, blocked, icon, usage in fingerprint
+        ]
+        self._applications_cache[account.user_id] = (fingerprint, applications)
+        return applications
+
+    def _collect_account(
+        self, account: Account
+    ) -> tuple[str, dict[str, Any], dict[str, tuple[Device, dict[str, Any]]]]:
+        """Transform an account and its devices for one update cycle."""
+        account_id, account_data = self._transform_account_data(account)
+        devices: dict[str, tuple[Device, dict[str, Any]]] = {}
+        for device in account.devices:
+            device_id, device_data = self._transform_device_data(device, account_id)
+            devices[device_id] = (device, device_data)
+        account_data["devices"] = list(devices)
+        account_data["device_count"] = len(devices)
+        return account_id, account_data, devices
+
     def _transform_device_data(self, device: Device, account_id: str) -> tuple[str, dict[str, Any]]:
         """Transform a Device object to dictionary format."""
         device_id = device.device_id
-        device_data = {
-            "device_id": device.device_id,
-            "device_name": device.device_name,
-            "device_class": device.device_class,
-            "device_make": device.device_make,
-            "device_model": device.device_model,
-            "os_name": device.os_name,
-            "today_time_used": _ms_to_minutes(device.today_time_used),
-            "last_seen": device.last_seen,
-            "blocked": device.blocked,
-            "account_id": account_id,
-        }
+        fingerprint = (*_get_device_fields(device), device.today_time_used, account_id)
+        cached = self._device_cache.get(device_id)
+        if cached is not None and cached[0] == fingerprint:
+            return device_id, cached[1]
+
+        device_data = dict(zip(_DEVICE_FIELDS, fingerprint))
+        device_data["today_time_used"] = _ms_to_minutes(device.today_time_used)
+        device_data["account_id"] = account_id
+        self._device_cache[device_id] = (fingerprint, device_data)
         return device_id, device_data
 
     async def _async_update_data(self) -> dict[str, Any]:
@@ -757,9 +895,10 @@ class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         await self._async_load_web_cookies()
 
         try:
-            await self.api.update()
+            async with asyncio.timeout(API_TIMEOUT):
+                await self.api.update()
 
-            if not hasattr(self.api, 'accounts') or self.api.accounts is None:
+            if self.api.accounts is None:
                 _LOGGER.warning("API accounts is None after update, initializing to empty list")
                 self.api.accounts = []
 
@@ -771,29 +910,38 @@ class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.debug("Found %d Family Safety accounts", len(self.api.accounts))
 
             for account in self.api.accounts:
-                account_id, account_data = self._transform_account_data(account)
+                try:
+                    account_id, account_data, account_devices = self._collect_account(account)
+                except Exception as err:
+                    # One malformed account must not take down every entity
+                    _LOGGER.warning(
+                        "Skipping account %s this cycle: %s",
+                        getattr(account, "user_id", "unknown"),
+                        err,
+                    )
+                    continue
                 accounts_data[account_id] = account_data
                 new_accounts[account_id] = account
-
-                for device in account.devices:
-                    device_id, device_data = self._transform_device_data(device, account_id)
+                for device_id, (device, device_data) in account_devices.items():
                     devices_data[device_id] = device_data
-                    accounts_data[account_id]["devices"].append(device_id)
                     new_devices[device_id] = device
 
                 # Fetch web API data for this account
                 web_data = await self._fetch_web_api_data(account_id)
-                accounts_data[account_id]["web_browsing"] = web_data.get("web_browsing")
-                accounts_data[account_id]["screentime_policy"] = web_data.get("screentime_policy")
+                account_data["web_browsing"] = web_data["web_browsing"]
+                account_data["screentime_policy"] = web_data["screentime_policy"]
 
             # Replace caches wholesale so removed accounts/devices are purged
+            self._update_account_index(new_accounts)
+            for stale_id in self._applications_cache.keys() - new_accounts.keys():
+                del self._applications_cache[stale_id]
+            for stale_id in self._device_cache.keys() - new_devices.keys():
+                del self._device_cache[stale_id]
             self._accounts = new_accounts
             self._devices = new_devices
 
             # Collect pending requests
-            pending_requests = []
-            if hasattr(self.api, 'pending_requests') and self.api.pending_requests:
-                pending_requests = self.api.pending_requests
+            pending_requests = self.api.pending_requests or []
 
             # Successful cycle — allow a future 401 to trigger the reauth flow
             self._is_retrying_auth = False
@@ -805,7 +953,7 @@ class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             }
 
         except HttpException as err:
-            if "401" in str(err) or "authentication" in str(err).lower():
+            if _is_auth_error(err):
                 if not self._is_retrying_auth:
                     _LOGGER.warning("Authentication failed, token may be expired")
                     self._is_retrying_auth = True
@@ -813,10 +961,25 @@ class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     raise ConfigEntryAuthFailed(ERROR_TOKEN_EXPIRED) from err
                 raise UpdateFailed(f"Authentication failed: {err}") from err
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        except TimeoutError as err:
+            _LOGGER.warning("Family Safety API did not respond within %ss", API_TIMEOUT)
+            raise UpdateFailed(ERROR_TIMEOUT) from err
         except Exception as err:
             _LOGGER.exception("Unexpected error fetching data: %s", err)
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
+    def _update_account_index(self, accounts: dict[str, Account]) -> None:
+        """Point the domain-wide account index at this coordinator.
+
+        Service handlers resolve the owning coordinator through this index
+        instead of scanning every config entry's data on each call.
+        """
+        index = self.hass.data.setdefault(DOMAIN, {}).setdefault(DATA_ACCOUNT_INDEX, {})
+        for account_id in self._accounts.keys() - accounts.keys():
+            if index.get(account_id) is self:
+                del index[account_id]
+        index.update(dict.fromkeys(accounts, self))
+
     async def _create_auth_notification(self) -> None:
         """Create a persistent notification when web cookies expire."""
         if self._auth_notification_sent:
@@ -855,9 +1018,17 @@ class FamilySafetyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def async_cleanup(self) -> None:
         """Clean up resources."""
+        self._update_account_index({})
         self._accounts.clear()
         self._devices.clear()
+        self._applications_cache.clear()
+        self._device_cache.clear()
         if self.web_api:
-            await self.web_api.close()
+            # Don't let a slow server hold up unload/reload while closing
+            try:
+                async with asyncio.timeout(_CLOSE_TIMEOUT):
+                    await self.web_api.close()
+            except TimeoutError:
+                _LOGGER.debug("Timed out closing web API sessions")
             self.web_api = None
         self.api = None
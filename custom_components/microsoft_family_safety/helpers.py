@@ -0,0 +1,11 @@
+"""Helpers shared by the config flow and integration setup."""
+from __future__ import annotations
+
+import hashlib
+
+
+def token_unique_id(refresh_token: str) -> str:
+    """Derive the config entry unique id from a refresh token."""
+    return hashlib.blake2b(
+        refresh_token.encode("utf-8"), digest_size=16, person=b"msfs-v1"
+    ).hexdigest()
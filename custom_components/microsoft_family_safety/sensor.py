@@ -1,7 +1,8 @@
 """Sensor platform for Microsoft Family Safety."""
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Iterator
+from datetime import date
 import logging
 from typing import Any
 
@@ -21,7 +22,6 @@ from .const import (
     ATTR_ACCOUNT_BALANCE,
     ATTR_ACCOUNT_CURRENCY,
     ATTR_AVERAGE_SCREENTIME,
-    ATTR_BLOCKED,
     ATTR_DEVICE_ID,
     ATTR_DEVICE_MODEL,
     ATTR_DEVICE_NAME,
@@ -32,6 +32,7 @@ from .const import (
     ATTR_SURNAME,
     ATTR_TODAY_TIME_USED,
     ATTR_USER_ID,
+    DATA_COORDINATORS,
     DOMAIN,
 )
 from .coordinator import FamilySafetyDataUpdateCoordinator
@@ -45,9 +46,8 @@ def _format_duration_attributes(total_seconds: int) -> dict[str, Any]:
     Returns a dictionary with formatted_time, hours, minutes, seconds, and total_seconds.
     This is compatible with Family Link-style attributes.
     """
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
 
     return {
         "total_seconds": total_seconds,
@@ -63,33 +63,30 @@ def _create_account_sensors(
     entry: ConfigEntry,
     account_id: str,
     account_data: dict[str, Any],
-) -> list[SensorEntity]:
+) -> Iterator[SensorEntity]:
     """Create all sensors for an account."""
-    sensors = [
-        FamilySafetyScreenTimeSensor(coordinator, entry, account_id),
-        FamilySafetyAccountInfoSensor(coordinator, entry, account_id),
-        FamilySafetyApplicationCountSensor(coordinator, entry, account_id),
-        FamilySafetyPendingRequestsSensor(coordinator, entry, account_id),
-        FamilySafetyWebFilterSensor(coordinator, entry, account_id),
-        FamilySafetyScreenTimePolicySensor(coordinator, entry, account_id),
-    ]
+    name = account_data.get(ATTR_FIRST_NAME, "Unknown")
+    yield FamilySafetyScreenTimeSensor(coordinator, entry, account_id, name)
+    yield FamilySafetyAccountInfoSensor(coordinator, entry, account_id, name)
+    yield FamilySafetyApplicationCountSensor(coordinator, entry, account_id, name)
+    yield FamilySafetyPendingRequestsSensor(coordinator, entry, account_id, name)
+    yield FamilySafetyWebFilterSensor(coordinator, entry, account_id, name)
+    yield FamilySafetyScreenTimePolicySensor(coordinator, entry, account_id, name)
 
     if account_data.get("account_balance") is not None:
-        sensors.append(FamilySafetyBalanceSensor(coordinator, entry, account_id))
-
-    return sensors
+        yield FamilySafetyBalanceSensor(coordinator, entry, account_id, name)
 
 
 def _create_device_sensors(
     coordinator: FamilySafetyDataUpdateCoordinator,
     entry: ConfigEntry,
     device_id: str,
-) -> list[SensorEntity]:
+    device_data: dict[str, Any],
+) -> Iterator[SensorEntity]:
     """Create all sensors for a device."""
-    return [
-        FamilySafetyDeviceScreenTimeSensor(coordinator, entry, device_id),
-        FamilySafetyDeviceInfoSensor(coordinator, entry, device_id),
-    ]
+    name = device_data.get(ATTR_DEVICE_NAME, "Unknown Device")
+    yield FamilySafetyDeviceScreenTimeSensor(coordinator, entry, device_id, name)
+    yield FamilySafetyDeviceInfoSensor(coordinator, entry, device_id, name)
 
 
 async def async_setup_entry(
@@ -98,7 +95,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Microsoft Family Safety sensors."""
-    coordinator: FamilySafetyDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators = hass.data[DOMAIN][DATA_COORDINATORS]
+    coordinator: FamilySafetyDataUpdateCoordinator = coordinators[entry.entry_id]
 
     # Integration-level connection/health sensor (issue #23)
     async_add_entities([FamilySafetyConnectionSensor(coordinator, entry)])
@@ -108,20 +106,24 @@ async def async_setup_entry(
 
     def _add_new_entities() -> None:
         """Add sensors for accounts/devices that appeared since last update."""
-        entities: list[SensorEntity] = []
-        data = coordinator.data or {}
+        data = coordinator.data
+        if not data:
+            return
 
-        for account_id, account_data in data.get("accounts", {}).items():
+        entities: list[SensorEntity] = []
+        for account_id, account_data in data["accounts"].items():
             if account_id not in known_accounts:
                 known_accounts.add(account_id)
                 entities.extend(
                     _create_account_sensors(coordinator, entry, account_id, account_data)
                 )
 
-        for device_id in data.get("devices", {}):
+        for device_id, device_data in data["devices"].items():
             if device_id not in known_devices:
                 known_devices.add(device_id)
-                entities.extend(_create_device_sensors(coordinator, entry, device_id))
+                entities.extend(
+                    _create_device_sensors(coordinator, entry, device_id, device_data)
+                )
 
         if entities:
             async_add_entities(entities)
@@ -130,7 +132,58 @@ async def async_setup_entry(
     entry.async_on_unload(coordinator.async_add_listener(_add_new_entities))
 
 
-class FamilySafetyAccountSensor(CoordinatorEntity, SensorEntity):
+_UNSET = object()
+
+
+class FamilySafetySensor(CoordinatorEntity, SensorEntity):
+    """Base class for sensors whose state is derived from coordinator data.
+
+    State and attributes are computed once per coordinator snapshot and
+    reused for every read until the next update.
+    """
+
+    def __init__(self, coordinator: FamilySafetyDataUpdateCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._state_source: Any = _UNSET
+        self._cached_native_value: Any = None
+        self._cached_attributes: dict[str, Any] | None = None
+
+    def _compute_native_value(self) -> Any:
+        """Compute the state from the current coordinator data."""
+        return None
+
+    def _compute_extra_state_attributes(self) -> dict[str, Any] | None:
+        """Compute the attributes from the current coordinator data."""
+        return None
+
+    def _state_key(self) -> Any:
+        """Return the object whose identity determines this sensor's state."""
+        return self.coordinator.data
+
+    def _ensure_state(self) -> None:
+        """Recompute state and attributes if their source changed."""
+        source = self._state_key()
+        if source is self._state_source:
+            return
+        self._state_source = source
+        self._cached_native_value = self._compute_native_value()
+        self._cached_attributes = self._compute_extra_state_attributes()
+
+    @property
+    def native_value(self) -> Any:
+        """Return the state for the current snapshot."""
+        self._ensure_state()
+        return self._cached_native_value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the attributes for the current snapshot."""
+        self._ensure_state()
+        return self._cached_attributes
+
+
+class FamilySafetyAccountSensor(FamilySafetySensor):
     """Base class for account-related sensors."""
 
     def __init__(
@@ -150,18 +203,11 @@ class FamilySafetyAccountSensor(CoordinatorEntity, SensorEntity):
             return None
         return self.coordinator.data.get("accounts", {}).get(self._account_id)
 
-    def _get_account_name(self) -> str:
-        """Get the account first name for entity naming."""
-        account_data = self._get_account_data()
-        return account_data.get(ATTR_FIRST_NAME, "Unknown") if account_data else "Unknown"
-
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info to link this entity to a child account device."""
         account_data = self._get_account_data()
-        first_name = account_data.get(ATTR_FIRST_NAME, "Unknown") if account_data else "Unknown"
-        surname = account_data.get(ATTR_SURNAME, "") if account_data else ""
-        full_name = f"{first_name} {surname}".strip()
+        full_name = account_data.get("display_name", "Unknown") if account_data else "Unknown"
         return DeviceInfo(
             identifiers={(DOMAIN, self._account_id)},
             name=f"{full_name} (Family Safety)",
@@ -171,7 +217,7 @@ class FamilySafetyAccountSensor(CoordinatorEntity, SensorEntity):
         )
 
 
-class FamilySafetyDeviceSensor(CoordinatorEntity, SensorEntity):
+class FamilySafetyDeviceSensor(FamilySafetySensor):
     """Base class for device-related sensors."""
 
     def __init__(
@@ -191,10 +237,9 @@ class FamilySafetyDeviceSensor(CoordinatorEntity, SensorEntity):
             return None
         return self.coordinator.data.get("devices", {}).get(self._device_id)
 
-    def _get_device_name(self) -> str:
-        """Get the device name for entity naming."""
-        device_data = self._get_device_data()
-        return device_data.get(ATTR_DEVICE_NAME, "Unknown Device") if device_data else "Unknown Device"
+    def _state_key(self) -> Any:
+        """Key on the device record, which is reused while it is unchanged."""
+        return self._get_device_data()
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -229,20 +274,19 @@ class FamilySafetyScreenTimeSensor(FamilySafetyAccountSensor):
         coordinator: FamilySafetyDataUpdateCoordinator,
         entry: ConfigEntry,
         account_id: str,
+        account_name: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, account_id)
         self._attr_unique_id = f"{entry.entry_id}_{account_id}_screentime"
-        self._attr_name = f"{self._get_account_name()} Screen Time"
+        self._attr_name = f"{account_name} Screen Time"
 
-    @property
-    def native_value(self) -> int | None:
+    def _compute_native_value(self) -> int | None:
         """Return the screen time in minutes."""
         account_data = self._get_account_data()
         return account_data.get("today_screentime_usage", 0) if account_data else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _compute_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
         account_data = self._get_account_data()
         if not account_data:
@@ -256,7 +300,7 @@ class FamilySafetyScreenTimeSensor(FamilySafetyAccountSensor):
             ATTR_USER_ID: account_data.get(ATTR_USER_ID),
             ATTR_AVERAGE_SCREENTIME: account_data.get("average_screentime_usage", 0),
             "state_class": "total",
-            "date": datetime.now().date().isoformat(),
+            "date": date.today().isoformat(),
             **_format_duration_attributes(total_seconds),
         }
 
@@ -271,25 +315,21 @@ class FamilySafetyAccountInfoSensor(FamilySafetyAccountSensor):
         coordinator: FamilySafetyDataUpdateCoordinator,
         entry: ConfigEntry,
         account_id: str,
+        account_name: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, account_id)
         self._attr_unique_id = f"{entry.entry_id}_{account_id}_info"
-        self._attr_name = f"{self._get_account_name()} Account Info"
+        self._attr_name = f"{account_name} Account Info"
 
-    @property
-    def native_value(self) -> str | None:
+    def _compute_native_value(self) -> str | None:
         """Return the account name."""
         account_data = self._get_account_data()
         if not account_data:
             return None
+        return account_data.get("display_name", "")
 
-        first_name = account_data.get(ATTR_FIRST_NAME, "")
-        surname = account_data.get(ATTR_SURNAME, "")
-        return f"{first_name} {surname}".strip()
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _compute_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
         account_data = self._get_account_data()
         if not account_data:
@@ -300,8 +340,8 @@ class FamilySafetyAccountInfoSensor(FamilySafetyAccountSensor):
             ATTR_FIRST_NAME: account_data.get(ATTR_FIRST_NAME),
             ATTR_SURNAME: account_data.get(ATTR_SURNAME),
             ATTR_PROFILE_PICTURE: account_data.get(ATTR_PROFILE_PICTURE),
-            "device_count": len(account_data.get("devices", [])),
-            "application_count": len(account_data.get("applications", [])),
+            "device_count": account_data.get("device_count", 0),
+            "application_count": account_data.get("application_count", 0),
         }
 
     @property
@@ -322,31 +362,27 @@ class FamilySafetyApplicationCountSensor(FamilySafetyAccountSensor):
         coordinator: FamilySafetyDataUpdateCoordinator,
         entry: ConfigEntry,
         account_id: str,
+        account_name: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, account_id)
         self._attr_unique_id = f"{entry.entry_id}_{account_id}_app_count"
-        self._attr_name = f"{self._get_account_name()} Applications"
+        self._attr_name = f"{account_name} Applications"
 
-    @property
-    def native_value(self) -> int | None:
+    def _compute_native_value(self) -> int | None:
         """Return the application count."""
         account_data = self._get_account_data()
-        return len(account_data.get("applications", [])) if account_data else None
+        return account_data.get("application_count", 0) if account_data else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _compute_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
         account_data = self._get_account_data()
         if not account_data:
             return {}
 
-        applications = account_data.get("applications", [])
-        blocked_apps = [app for app in applications if app.get("blocked")]
-
         return {
-            "blocked_count": len(blocked_apps),
-            "applications": applications,
+            "blocked_count": account_data.get("blocked_app_count", 0),
+            "applications": account_data["applications"],
         }
 
 
@@ -362,20 +398,20 @@ class FamilySafetyBalanceSensor(FamilySafetyAccountSensor):
         coordinator: FamilySafetyDataUpdateCoordinator,
         entry: ConfigEntry,
         account_id: str,
+        account_name: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, account_id)
         self._attr_unique_id = f"{entry.entry_id}_{account_id}_balance"
 
         account_data = self._get_account_data()
-        self._attr_name = f"{self._get_account_name()} Balance"
+        self._attr_name = f"{account_name} Balance"
         if account_data:
             self._attr_native_unit_of_measurement = account_data.get(
                 ATTR_ACCOUNT_CURRENCY, "USD"
             )
 
-    @property
-    def native_value(self) -> float | None:
+    def _compute_native_value(self) -> float | None:
         """Return the account balance."""
         account_data = self._get_account_data()
         return account_data.get(ATTR_ACCOUNT_BALANCE) if account_data else None
@@ -394,20 +430,23 @@ class FamilySafetyDeviceScreenTimeSensor(FamilySafetyDeviceSensor):
         coordinator: FamilySafetyDataUpdateCoordinator,
         entry: ConfigEntry,
         device_id: str,
+        device_name: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, device_id)
         self._attr_unique_id = f"{entry.entry_id}_{device_id}_screentime"
-        self._attr_name = f"{self._get_device_name()} Screen Time"
+        self._attr_name = f"{device_name} Screen Time"
 
-    @property
-    def native_value(self) -> int | None:
+    def _state_key(self) -> Any:
+        """Key on the snapshot, since the "date" attribute rolls over daily."""
+        return self.coordinator.data
+
+    def _compute_native_value(self) -> int | None:
         """Return the screen time in minutes."""
         device_data = self._get_device_data()
         return device_data.get(ATTR_TODAY_TIME_USED, 0) if device_data else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _compute_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
         device_data = self._get_device_data()
         if not device_data:
@@ -421,7 +460,7 @@ class FamilySafetyDeviceScreenTimeSensor(FamilySafetyDeviceSensor):
             ATTR_DEVICE_ID: device_data.get(ATTR_DEVICE_ID),
             ATTR_DEVICE_NAME: device_data.get(ATTR_DEVICE_NAME),
             "state_class": "total",
-            "date": datetime.now().date().isoformat(),
+            "date": date.today().isoformat(),
             **_format_duration_attributes(total_seconds),
         }
 
@@ -436,20 +475,19 @@ class FamilySafetyDeviceInfoSensor(FamilySafetyDeviceSensor):
         coordinator: FamilySafetyDataUpdateCoordinator,
         entry: ConfigEntry,
         device_id: str,
+        device_name: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, device_id)
         self._attr_unique_id = f"{entry.entry_id}_{device_id}_info"
-        self._attr_name = f"{self._get_device_name()} Info"
+        self._attr_name = f"{device_name} Info"
 
-    @property
-    def native_value(self) -> str | None:
+    def _compute_native_value(self) -> str | None:
         """Return the device name."""
         device_data = self._get_device_data()
         return device_data.get(ATTR_DEVICE_NAME) if device_data else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _compute_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
         device_data = self._get_device_data()
         if not device_data:
@@ -477,14 +515,14 @@ class FamilySafetyPendingRequestsSensor(FamilySafetyAccountSensor):
         coordinator: FamilySafetyDataUpdateCoordinator,
         entry: ConfigEntry,
         account_id: str,
+        account_name: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, account_id)
         self._attr_unique_id = f"{entry.entry_id}_{account_id}_pending_requests"
-        self._attr_name = f"{self._get_account_name()} Pending Requests"
+        self._attr_name = f"{account_name} Pending Requests"
 
-    @property
-    def native_value(self) -> int:
+    def _compute_native_value(self) -> int:
         """Return the number of pending requests for this account."""
         if not self.coordinator.data:
             return 0
@@ -494,8 +532,7 @@ class FamilySafetyPendingRequestsSensor(FamilySafetyAccountSensor):
         ]
         return len(account_requests)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _compute_extra_state_attributes(self) -> dict[str, Any]:
         """Return pending requests details."""
         if not self.coordinator.data:
             return {}
@@ -519,14 +556,14 @@ class FamilySafetyWebFilterSensor(FamilySafetyAccountSensor):
         coordinator: FamilySafetyDataUpdateCoordinator,
         entry: ConfigEntry,
         account_id: str,
+        account_name: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, account_id)
         self._attr_unique_id = f"{entry.entry_id}_{account_id}_web_filter"
-        self._attr_name = f"{self._get_account_name()} Web Filter"
+        self._attr_name = f"{account_name} Web Filter"
 
-    @property
-    def native_value(self) -> str | None:
+    def _compute_native_value(self) -> str | None:
         """Return the web filter status."""
         account_data = self._get_account_data()
         if not account_data:
@@ -552,8 +589,7 @@ class FamilySafetyWebFilterSensor(FamilySafetyAccountSensor):
             return "mdi:web-off"
         return "mdi:web"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _compute_extra_state_attributes(self) -> dict[str, Any]:
         """Return web filtering details."""
         account_data = self._get_account_data()
         if not account_data:
@@ -591,14 +627,14 @@ class FamilySafetyScreenTimePolicySensor(FamilySafetyAccountSensor):
         coordinator: FamilySafetyDataUpdateCoordinator,
         entry: ConfigEntry,
         account_id: str,
+        account_name: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, account_id)
         self._attr_unique_id = f"{entry.entry_id}_{account_id}_screentime_policy"
-        self._attr_name = f"{self._get_account_name()} Screen Time Policy"
+        self._attr_name = f"{account_name} Screen Time Policy"
 
-    @property
-    def native_value(self) -> str | None:
+    def _compute_native_value(self) -> str | None:
         """Return whether screen time limits are enabled."""
         account_data = self._get_account_data()
         if not account_data:
@@ -623,8 +659,7 @@ class FamilySafetyScreenTimePolicySensor(FamilySafetyAccountSensor):
             return "mdi:clock-remove"
         return "mdi:clock-outline"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _compute_extra_state_attributes(self) -> dict[str, Any]:
         """Return screen time policy details."""
         account_data = self._get_account_data()
         if not account_data:
@@ -1,26 +1,31 @@
 """Switch platform for Microsoft Family Safety."""
 from __future__ import annotations
 
+from collections.abc import Awaitable
 import logging
 from typing import Any
 
+import aiohttp
+from pyfamilysafety.exceptions import HttpException
+
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api_client import FamilySafetyWebAPIError
 from .const import (
     ATTR_APP_ID,
     ATTR_APP_NAME,
     ATTR_BLOCKED,
-    ATTR_DEVICE_NAME,
     ATTR_FIRST_NAME,
     ATTR_PLATFORM,
     ATTR_USER_ID,
-    AVAILABLE_PLATFORMS,
     CONF_PLATFORMS,
+    DATA_COORDINATORS,
     DEFAULT_PLATFORMS,
     DOMAIN,
 )
@@ -28,6 +33,26 @@ from .coordinator import FamilySafetyDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# State comes from the coordinator, so entity updates need no throttling
+PARALLEL_UPDATES = 0
+
+# Failures a control call can surface: pyfamilysafety and web API errors,
+# the add-on client's RuntimeError, and the transport errors underneath them
+_CONTROL_ERRORS = (
+    HttpException,
+    FamilySafetyWebAPIError,
+    RuntimeError,
+    aiohttp.ClientError,
+    TimeoutError,
+)
+
+# Platform -> (locked, unlocked) icon
+_PLATFORM_ICONS: dict[str, tuple[str, str]] = {
+    "Windows": ("mdi:microsoft-windows", "mdi:microsoft-windows"),
+    "Xbox": ("mdi:microsoft-xbox", "mdi:microsoft-xbox"),
+    "Mobile": ("mdi:cellphone-lock", "mdi:cellphone"),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,10 +60,13 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Microsoft Family Safety switches."""
-    coordinator: FamilySafetyDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators = hass.data[DOMAIN][DATA_COORDINATORS]
+    coordinator: FamilySafetyDataUpdateCoordinator = coordinators[entry.entry_id]
 
     known_accounts: set[str] = set()
     known_apps: set[tuple[str, str]] = set()
+    # Options changes reload the entry, so this is fixed for its lifetime
+    enabled_platforms = entry.options.get(CONF_PLATFORMS, DEFAULT_PLATFORMS)
 
     def _add_new_entities() -> None:
         """Add switches for accounts/apps that appeared since last update."""
@@ -49,7 +77,7 @@ async def async_setup_entry(
             account_name = account_data.get(ATTR_FIRST_NAME, "Unknown")
 
             # Create app block switches for each (new) application
-            for app in account_data.get("applications", []):
+            for app in account_data["applications"]:
                 app_key = (account_id, app["app_id"])
                 if app_key in known_apps:
                     continue
@@ -66,7 +94,6 @@ async def async_setup_entry(
             known_accounts.add(account_id)
 
             # Create per-platform lock switches only for selected platforms
-            enabled_platforms = entry.options.get(CONF_PLATFORMS, DEFAULT_PLATFORMS)
             for platform in enabled_platforms:
                 entities.append(
                     FamilySafetyPlatformLockSwitch(
@@ -95,7 +122,31 @@ async def async_setup_entry(
     entry.async_on_unload(coordinator.async_add_listener(_add_new_entities))
 
 
-class FamilySafetyAppBlockSwitch(CoordinatorEntity, SwitchEntity):
+class FamilySafetySwitch(CoordinatorEntity, SwitchEntity):
+    """Base class for switches that drive a coordinator control call."""
+
+    # Set by switches that show the requested state before the call completes
+    _optimistic_state: bool | None = None
+
+    async def _async_control(self, action: str, call: Awaitable[None]) -> None:
+        """Await a control call, surfacing API failures as HomeAssistantError.
+
+        On failure any optimistic state is rolled back right away. On success
+        it is only cleared, and the coordinator refresh writes the new state.
+        """
+        try:
+            await call
+        except Exception as err:
+            if self._optimistic_state is not None:
+                self._optimistic_state = None
+                self.async_write_ha_state()
+            if isinstance(err, _CONTROL_ERRORS):
+                raise HomeAssistantError(f"Failed to {action}: {err}") from err
+            raise
+        self._optimistic_state = None
+
+
+class FamilySafetyAppBlockSwitch(FamilySafetySwitch):
     """Switch to block/unblock an application."""
 
     _attr_icon = "mdi:application"
@@ -133,15 +184,7 @@ class FamilySafetyAppBlockSwitch(CoordinatorEntity, SwitchEntity):
 
     def _get_app_data(self) -> dict[str, Any] | None:
         """Get app data from coordinator."""
-        if not self.coordinator.data:
-            return None
-        account = self.coordinator.data.get("accounts", {}).get(self._account_id)
-        if not account:
-            return None
-        for app in account.get("applications", []):
-            if app["app_id"] == self._app_id:
-                return app
-        return None
+        return self.coordinator.get_app_record(self._account_id, self._app_id)
 
     @property
     def is_on(self) -> bool | None:
@@ -175,15 +218,21 @@ class FamilySafetyAppBlockSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Block the application."""
         _LOGGER.info("Blocking app %s for account %s", self._app_name, self._account_name)
-        await self.coordinator.async_block_app(self._account_id, self._app_id)
+        await self._async_control(
+            f"block {self._app_name}",
+            self.coordinator.async_block_app(self._account_id, self._app_id),
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Unblock the application."""
         _LOGGER.info("Unblocking app %s for account %s", self._app_name, self._account_name)
-        await self.coordinator.async_unblock_app(self._account_id, self._app_id)
+        await self._async_control(
+            f"unblock {self._app_name}",
+            self.coordinator.async_unblock_app(self._account_id, self._app_id),
+        )
 
 
-class FamilySafetyPlatformLockSwitch(CoordinatorEntity, SwitchEntity):
+class FamilySafetyPlatformLockSwitch(FamilySafetySwitch):
     """Switch to lock/unlock a platform (Windows/Xbox/Mobile)."""
 
     def __init__(
@@ -202,6 +251,11 @@ class FamilySafetyPlatformLockSwitch(CoordinatorEntity, SwitchEntity):
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_{account_id}_platform_{platform.lower()}"
         self._attr_name = f"{account_name} {platform} Lock"
+        self._state_source: dict[str, Any] | None = None
+        self._locked: bool | None = None
+        self._locked_icon, self._unlocked_icon = _PLATFORM_ICONS.get(
+            platform, ("mdi:lock", "mdi:lock-open")
+        )
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -216,26 +270,22 @@ class FamilySafetyPlatformLockSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if the platform is LOCKED (switch ON = locked)."""
-        if not self.coordinator.data:
-            return None
-        account = self.coordinator.data.get("accounts", {}).get(self._account_id)
-        if not account:
-            return None
-        blocked_platforms = account.get("blocked_platforms", [])
-        return self._platform in blocked_platforms
+        # icon and attributes read this too; resolve once per snapshot
+        data = self.coordinator.data
+        if data is not self._state_source:
+            self._state_source = data
+            account = data["accounts"].get(self._account_id) if data else None
+            self._locked = (
+                self._platform in account.get("blocked_platforms", [])
+                if account
+                else None
+            )
+        return self._locked
 
     @property
     def icon(self) -> str:
         """Return icon based on platform and state."""
-        icons = {
-            "Windows": ("mdi:microsoft-windows", "mdi:microsoft-windows"),
-            "Xbox": ("mdi:microsoft-xbox", "mdi:microsoft-xbox"),
-            "Mobile": ("mdi:cellphone-lock", "mdi:cellphone"),
-        }
-        locked, unlocked = icons.get(self._platform, ("mdi:lock", "mdi:lock-open"))
-        if self.is_on:
-            return locked
-        return unlocked
+        return self._locked_icon if self.is_on else self._unlocked_icon
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -253,7 +303,10 @@ class FamilySafetyPlatformLockSwitch(CoordinatorEntity, SwitchEntity):
             "Attempting legacy lock for %s / %s",
             self._platform, self._account_name,
         )
-        await self.coordinator.async_lock_platform(self._account_id, self._platform)
+        await self._async_control(
+            f"lock {self._platform}",
+            self.coordinator.async_lock_platform(self._account_id, self._platform),
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Unlock the platform (deprecated — use Account Lock switch instead)."""
@@ -262,10 +315,13 @@ class FamilySafetyPlatformLockSwitch(CoordinatorEntity, SwitchEntity):
             "Attempting legacy unlock for %s / %s",
             self._platform, self._account_name,
         )
-        await self.coordinator.async_unlock_platform(self._account_id, self._platform)
+        await self._async_control(
+            f"unlock {self._platform}",
+            self.coordinator.async_unlock_platform(self._account_id, self._platform),
+        )
 
 
-class FamilySafetyAccountLockSwitch(CoordinatorEntity, SwitchEntity):
+class FamilySafetyAccountLockSwitch(FamilySafetySwitch):
     """Switch to lock/unlock an entire child account via screen time zeroing.
 
     ON  = account locked (all 7 days screen time set to 0, all intervals blocked)
@@ -288,7 +344,6 @@ class FamilySafetyAccountLockSwitch(CoordinatorEntity, SwitchEntity):
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_{account_id}_account_lock"
         self._attr_name = f"{account_name} Lock"
-        self._optimistic_state: bool | None = None
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -328,29 +383,23 @@ class FamilySafetyAccountLockSwitch(CoordinatorEntity, SwitchEntity):
         _LOGGER.info("Locking account %s", self._account_name)
         self._optimistic_state = True
         self.async_write_ha_state()
-        try:
-            await self.coordinator.async_lock_account(self._account_id)
-            self._optimistic_state = None
-        except Exception:
-            self._optimistic_state = None
-            self.async_write_ha_state()
-            raise
+        await self._async_control(
+            "lock account",
+            self.coordinator.async_lock_account(self._account_id),
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Unlock the account (optimistic update)."""
         _LOGGER.info("Unlocking account %s", self._account_name)
         self._optimistic_state = False
         self.async_write_ha_state()
-        try:
-            await self.coordinator.async_unlock_account(self._account_id)
-            self._optimistic_state = None
-        except Exception:
-            self._optimistic_state = None
-            self.async_write_ha_state()
-            raise
+        await self._async_control(
+            "unlock account",
+            self.coordinator.async_unlock_account(self._account_id),
+        )
 
 
-class FamilySafetyScreenTimePolicySwitch(CoordinatorEntity, SwitchEntity):
+class FamilySafetyScreenTimePolicySwitch(FamilySafetySwitch):
     """Switch to enable/disable screen time limits for a child account.
 
     Mirrors the Microsoft Family Safety app's screen time limits toggle
@@ -378,7 +427,6 @@ class FamilySafetyScreenTimePolicySwitch(CoordinatorEntity, SwitchEntity):
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_{account_id}_screentime_policy"
         self._attr_name = f"{account_name} Screen Time Limits"
-        self._optimistic_state: bool | None = None
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -416,23 +464,17 @@ class FamilySafetyScreenTimePolicySwitch(CoordinatorEntity, SwitchEntity):
         _LOGGER.info("Enabling screen time limits for %s", self._account_name)
         self._optimistic_state = True
         self.async_write_ha_state()
-        try:
-            await self.coordinator.async_set_policy_enabled(self._account_id, True)
-            self._optimistic_state = None
-        except Exception:
-            self._optimistic_state = None
-            self.async_write_ha_state()
-            raise
+        await self._async_control(
+            "enable screen time limits",
+            self.coordinator.async_set_policy_enabled(self._account_id, True),
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable screen time limits (grant unlimited time)."""
         _LOGGER.info("Disabling screen time limits for %s", self._account_name)
         self._optimistic_state = False
         self.async_write_ha_state()
-        try:
-            await self.coordinator.async_set_policy_enabled(self._account_id, False)
-            self._optimistic_state = None
-        except Exception:
-            self._optimistic_state = None
-            self.async_write_ha_state()
-            raise
+        await self._async_control(
+            "disable screen time limits",
+            self.coordinator.async_set_policy_enabled(self._account_id, False),
+        )
@@ -13,7 +13,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTR_FIRST_NAME, ATTR_SURNAME, DAYS, DOMAIN
+from .const import ATTR_FIRST_NAME, DATA_COORDINATORS, DAYS, DOMAIN
 from .coordinator import FamilySafetyDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -104,7 +104,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Microsoft Family Safety time entities."""
-    coordinator: FamilySafetyDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators = hass.data[DOMAIN][DATA_COORDINATORS]
+    coordinator: FamilySafetyDataUpdateCoordinator = coordinators[entry.entry_id]
 
     known_accounts: set[str] = set()
 
@@ -174,9 +175,7 @@ class FamilySafetyIntervalTime(CoordinatorEntity, TimeEntity):
     def device_info(self) -> DeviceInfo:
         """Return device info to link this entity to a child account device."""
         account_data = self._get_account_data()
-        first_name = account_data.get(ATTR_FIRST_NAME, "Unknown") if account_data else "Unknown"
-        surname = account_data.get(ATTR_SURNAME, "") if account_data else ""
-        full_name = f"{first_name} {surname}".strip()
+        full_name = account_data.get("display_name", "Unknown") if account_data else "Unknown"
         return DeviceInfo(
             identifiers={(DOMAIN, self._account_id)},
             name=f"{full_name} (Family Safety)",